@@ -4,6 +4,7 @@ Polynomial helpers.  Mostly wrappers on Numpy functions with some added help to
 
 from pyee.types.aliases import t_numeric, t_numericArray
 import numpy as np
+from numpy.polynomial.polynomial import polyval
 
 def polyadd(c1, c2):
     """
@@ -38,27 +39,26 @@ def polyeval(c: t_numericArray, x: t_numericArray | t_numeric) -> t_numericArray
     Array index into c is the exponent
     """
 
-    x_a = np.array(x)
-    partsum = np.zeros_like(x_a)
-    for e, a in enumerate(c): # iter in case lots of values...
-        partsum = partsum + a * np.power(x_a,e) # equiv to +=? casting works better here...
-    rval = partsum.squeeze()
+    x_a = np.asarray(x)
+    rval = np.asarray(polyval(x_a, c)).squeeze() # Horner's method, no per-power temporaries
     return rval
 
 def polymul(c1, c2):
     """
     Multiplies two coefficient arrays.  Like the old polymul from np, but skips all the new
     polynomial stuff
+
+    Always a direct convolution - an FFT is faster on long arrays, but its error scales with
+    the largest coefficient, which swamps the small high order terms of transfer functions.
     """
+    a1 = np.asarray(c1)
+    a2 = np.asarray(c2)
+    dtype = np.result_type(a1, a2, float)
 
-    fullmul = np.zeros((len(c1)+len(c2),1))
-    for e1, a in enumerate(c1):
-        for e2, b in enumerate(c2):
-            fullmul[e1+e2] += a*b
-    
-    sqmul = fullmul.squeeze()
-    nzi = np.max(sqmul.nonzero())+1
-    rval = sqmul[:nzi]
+    fullmul = np.convolve(a1.astype(dtype), a2.astype(dtype))
+
+    nz = np.flatnonzero(fullmul) # trim trailing zeros, keeping at least one coefficient
+    rval = fullmul[:nz[-1]+1] if len(nz) else fullmul[:1]
 
     return rval
 
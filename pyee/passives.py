@@ -42,7 +42,7 @@ class PassiveComponent(PhysicalQuantity, metaclass=ABCMeta):
     def __init__(self, value:t_numeric, prefix:t_PrefixObj, units:t_UnitObj, *args, **kwargs) -> None:
         if (self.default_units is not None) and (units != self.default_units):
             if units.unitless:
-                units = self.default_units.copy()
+                units = self.default_units
             else: # no units is OK - use default. if wrong units give... raise issue with it.
                 try:
                     su = units.simplify()
@@ -84,9 +84,9 @@ class PassiveComponent(PhysicalQuantity, metaclass=ABCMeta):
     def __or__(self, other):
         try:
             nv = self * other / (self + other)
-            return {"Ohm": lambda o: Resistor.from_value(value=o.v*o.p),
-                    "F": lambda o: Capacitor.from_value(value=o.v*o.p),
-                    "L": lambda o: Inductor.from_value(value=o.v*o.p)}.get(str(nv.u), lambda o: o)(nv)
+            return {"Ohm": lambda o: Resistor.from_value(value=o.v*o.p.f),
+                    "F": lambda o: Capacitor.from_value(value=o.v*o.p.f),
+                    "L": lambda o: Inductor.from_value(value=o.v*o.p.f)}.get(str(nv.u), lambda o: o)(nv)
         except (TypeError, AttributeError) as _:
             logger.warning(f"Unable to parallel natively - converting to impedance... {self} and {other}")
         
@@ -98,9 +98,9 @@ class PassiveComponent(PhysicalQuantity, metaclass=ABCMeta):
         #TODO if units are the same on self and other, return correct passive type if possible
         try:
             nv = other * self / (other + self)
-            return {"Ohm": lambda o: Resistor.from_value(value=o.v * o.p),
-                    "F": lambda o: Capacitor.from_value(value=o.v * o.p),
-                    "L": lambda o: Inductor.from_value(value=o.v * o.p)}.get(str(nv.u), lambda o: o)(nv)
+            return {"Ohm": lambda o: Resistor.from_value(value=o.v * o.p.f),
+                    "F": lambda o: Capacitor.from_value(value=o.v * o.p.f),
+                    "L": lambda o: Inductor.from_value(value=o.v * o.p.f)}.get(str(nv.u), lambda o: o)(nv)
         except (TypeError, AttributeError) as _:
             logger.warning(f"Unable to parallel natively - converting to impedance... {other} and {self}")
         
@@ -154,7 +154,7 @@ class Resistor(PassiveComponent):
 
     @property
     def Z(self):
-        return Impedance(num=[self.v*self.p],den=[1], frequency_units=DEFAULT_FREQUENCY_UNITS)
+        return Impedance(num=[self.v*self.p.f],den=[1], frequency_units=DEFAULT_FREQUENCY_UNITS)
     
     @property
     def default_units(self) -> t_UnitObj:
@@ -165,7 +165,7 @@ class Inductor(PassiveComponent):
 
     @property
     def Z(self):
-        return Impedance(num=[0, self.v * self.p], den=[1], frequency_units=DEFAULT_FREQUENCY_UNITS)
+        return Impedance(num=[0, self.v * self.p.f], den=[1], frequency_units=DEFAULT_FREQUENCY_UNITS)
     
     @property
     def default_units(self) -> t_UnitObj:
@@ -176,7 +176,7 @@ class Capacitor(PassiveComponent):
 
     @property
     def Z(self):
-        return Impedance(num=[1],den=[0, self.v*self.p], frequency_units=DEFAULT_FREQUENCY_UNITS)
+        return Impedance(num=[1],den=[0, self.v*self.p.f], frequency_units=DEFAULT_FREQUENCY_UNITS)
     
     @property
     def default_units(self) -> t_UnitObj:
@@ -5,7 +5,7 @@ Regular expressions used by this module for stuff...
 import re
 
 # matches: 1e3 10 1.0k 0.1k etc.  Creates match group for number and prefix.
-re_number_and_prefix = re.compile(r"^(?P<number>(?:[-+]?\d+\.?\d*[eE][-+]?\d+)|(?:[-+]?\d+(\.\d+)?))(?P<prefix>[a-zA-Z]?)$")
+re_number_and_prefix = re.compile(r"^(?P<number>(?:[-+]?\d+\.?\d*[eE][-+]?\d+)|(?:[-+]?\d+(\.\d+)?))(?P<prefix>[a-zA-Z]?)$", re.ASCII)
 
 # matches: /(a^b), /(a), /(a.b^c), etc.  For matching grouped denominators in unit strings
 re_ustring_den_group = re.compile(r"/\(([a-zA-Z]+(?:\^[+-]?\d+)?|1)?(?:\.+[a-zA-Z]+(?:\^[+-]?\d+)?)*\)")
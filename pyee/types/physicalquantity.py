@@ -18,7 +18,7 @@ from pyee.types.converters import vp_from_number
 from pyee.types.aliases import t_numeric
 from pyee.types.aliases import t_listTuple
 
-from pyee.config import t_NumericConfig, t_BoolConfig
+from pyee.config import t_NumericConfig
 
 from pyee import GLOBAL_TOLERANCE, ERROR_ON_UNITLESS_OPERATORS
 
@@ -32,7 +32,23 @@ type t_DPQObj = DependantPhysicalQuantity
 
 logger = logging.getLogger(__name__)
 
+# relative tolerance for == on quantity values.  value/prefix splits differ in round-off
+# (1000 mV vs 1 V, or 0.1 + 0.2 vs 0.3), so exact float equality is too strict.
+EQUALITY_RTOL = 1e-12
+
+def _values_close(a, b):
+    """
+    Compares quantity values to EQUALITY_RTOL.  Elementwise for arrays, and False for anything
+    that is not a number.
+    """
+    try:
+        return np.isclose(a, b, rtol=EQUALITY_RTOL, atol=0)
+    except TypeError:
+        return False
+
 class PhysicalQuantityBase(object, metaclass=ABCMeta):
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def from_string(cls, ustring, **kwargs) -> t_PQBObj:
@@ -59,6 +75,7 @@ class PhysicalQuantityBase(object, metaclass=ABCMeta):
 
 
 class PhysicalQuantity(PhysicalQuantityBase):
+    __slots__ = ("v", "p", "u")
     __DEBUG = False
 
     @classmethod
@@ -100,9 +117,8 @@ class PhysicalQuantity(PhysicalQuantityBase):
 
     def __copy__(self) -> t_PQObj:
         nv = self.v # value is a number, no need to copy it
-        np = self.p.copy() # prefix object - needs copy
-        nu = self.u.copy() # units is an object - needs a copy
-        return type(self)(nv, np, nu)
+        # prefix and units are shared, read-only objects - a new quantity can hold the same ones
+        return type(self)(nv, self.p, self.u)
 
     def __repr__(self):
         return f"{self.v:7.3f}{self.p} [{self.u}]"
@@ -114,7 +130,7 @@ class PhysicalQuantity(PhysicalQuantityBase):
         elif ERROR_ON_UNITLESS_OPERATORS: # try as scalar? Assuming units..
             raise TypeError(f"Unable to multiply - no units on other? Acting on [{self}] * [{other}]")
         else: #try scalar multiply
-            nv, np = vp_from_number(self.v*self.p*other)
+            nv, np = vp_from_number(self.v*self.p.f*other)
             nu = self.u
         return PhysicalQuantity(nv, np, nu)
 
@@ -124,34 +140,34 @@ class PhysicalQuantity(PhysicalQuantityBase):
     def __sub__(self, other):
         if isinstance(other, PhysicalQuantity):
             if self.u != other.u: raise UnitsMissmatchException(u1=self.u, u2=other.u, operation="sub")
-            nv, np = vp_from_number(self.v*self.p - other.v*other.p) #type: ignore
+            nv, np = vp_from_number(self.v*self.p.f - other.v*other.p.f) #type: ignore
         elif ERROR_ON_UNITLESS_OPERATORS: # try as scalar? Assuming units..
             raise TypeError(f"Unable to subtract - no units on other? Acting on [{self}] - [{other}]")
         else: # try as scalar? Assuming units..
             logger.warning(f"Assuming units for subtraction: {self} - {other}")
-            nv, np = vp_from_number(self.v*self.p - other)
+            nv, np = vp_from_number(self.v*self.p.f - other)
         return PhysicalQuantity(value=nv, prefix=np, units=self.u)
 
     def __rsub__(self, other):
         if isinstance(other, PhysicalQuantity):
             if self.u != other.u: raise UnitsMissmatchException(u1=self.u, u2=other.u, operation="rsub")
-            nv, np = vp_from_number(other.v*other.p - self.v*self.p) #type: ignore
+            nv, np = vp_from_number(other.v*other.p.f - self.v*self.p.f) #type: ignore
         elif ERROR_ON_UNITLESS_OPERATORS: # try as scalar? Assuming units..
             raise TypeError(f"Unable to subtract - no units on other? Acting on [{other}] - [{self}]")
         else: # try as scalar? Assuming units..
             logger.warning(f"Assuming units for subtraction: {other} - {self}")
-            nv, np = vp_from_number(other - self.v*self.p)
+            nv, np = vp_from_number(other - self.v*self.p.f)
         return PhysicalQuantity(value=nv, prefix=np, units=self.u)
 
     def __add__(self, other):
         if isinstance(other, PhysicalQuantity):
             if self.u != other.u: raise UnitsMissmatchException(u1=self.u, u2=other.u, operation="add")
-            nv, np = vp_from_number(self.v*self.p + other.v*other.p) #type: ignore
+            nv, np = vp_from_number(self.v*self.p.f + other.v*other.p.f) #type: ignore
         elif ERROR_ON_UNITLESS_OPERATORS: # try as scalar? Assuming units..
             raise TypeError(f"Unable to add - no units on other? Acting on [{self}] + [{other}]")
         else: # try as scalar? Assuming units..
             logger.warning(f"Assuming units for addition: {self} + {other}")
-            nv, np = vp_from_number(self.v*self.p + other)
+            nv, np = vp_from_number(self.v*self.p.f + other)
         return PhysicalQuantity(value=nv, prefix=np, units=self.u)
 
     def __radd__(self, other):
@@ -166,7 +182,7 @@ class PhysicalQuantity(PhysicalQuantityBase):
             raise TypeError(f"Unable to divide - no units on other? Acting on [{self}] / [{other}]")
         else: # try as scalar? Assuming units..
             logger.warning(f"Assuming units for division: {self}/{other}")
-            nv, np = vp_from_number((self.v*self.p)/other)
+            nv, np = vp_from_number((self.v*self.p.f)/other)
             nu = self.u
         return PhysicalQuantity(value=nv, prefix=np, units=nu)
 
@@ -180,7 +196,7 @@ class PhysicalQuantity(PhysicalQuantityBase):
         else: # try as scalar? Assuming units..
             logger.warning(f"Assuming units for rdivision: {other}/{self}")
             logger.warning(f"self units... {self.u}")
-            nv, np = vp_from_number(other/(self.v*self.p))
+            nv, np = vp_from_number(other/(self.v*self.p.f))
             nu = 1/self.u
         return PhysicalQuantity(value=nv, prefix=np, units=nu)
 
@@ -195,14 +211,14 @@ class PhysicalQuantity(PhysicalQuantityBase):
             if self.u != other.u:
                 return False
             else:
-                return self.v*self.p == other.v*other.p
+                return _values_close(self.v*self.p.f, other.v*other.p.f)
         elif self.u == "1":
-            return self.v*self.p == other
+            return _values_close(self.v*self.p.f, other)
         elif ERROR_ON_UNITLESS_OPERATORS: # try as scalar? Assuming units..
             raise TypeError(f"Unable to check equlity - no units on other? Acting on [{self}] == [{other}]")
         else:
             logger.warning(f"Assuming units for equality: {self} == {other}")
-            return self.v*self.p == other
+            return _values_close(self.v*self.p.f, other)
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -227,7 +243,7 @@ class PhysicalQuantity(PhysicalQuantityBase):
         newunits = Units.from_any(val)
         if not self.u.unitless:
             convfunc = self.u.convert_to(newunits)
-            newval = convfunc(self.v*self.p)
+            newval = convfunc(self.v*self.p.f)
             self.v, self.p = vp_from_number(newval)
         self.u = newunits    
 
@@ -239,7 +255,7 @@ class PhysicalQuantity(PhysicalQuantityBase):
         """
 
         newunits = self.u.as_base(**kwargs)
-        return PhysicalQuantity(value=self.v, prefix=self.p.copy(), units=newunits)
+        return PhysicalQuantity(value=self.v, prefix=self.p, units=newunits)
 
     def simplify(self, **kwargs) -> t_PQObj:
         newunits = self.u.simplify(**kwargs)
@@ -267,6 +283,7 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
     When two dependant physical quanitites are acted on by a math operator, the left argument
     default value is retained.
     """
+    __slots__ = ("u", "num", "den", "tol", "_var0", "_var_symbol")
     __DEBUG = False
 
     @classmethod
@@ -312,7 +329,8 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
         :param var_units: variable units
         """
         super().__init__()
-        self.u = Units.from_any(units)
+        # arithmetic results already hand over a Units instance - skip the from_any dispatch for those
+        self.u = units if isinstance(units, Units) else Units.from_any(units)
 
         self.num = np.array(num)
         self.den = np.array(den)
@@ -329,7 +347,7 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
     def __copy__(self) -> t_DPQObj:
         return type(self)(num=self.num.copy(),
                           den=self.den.copy(),
-                          units=self.u.copy(),
+                          units=self.u,
                           var0=self._var0.copy() if self._var0 is not None else None,
                           var_symbol=self._var_symbol, 
                           tol=self.tol)
@@ -354,7 +372,7 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
 
     def __mul__(self, other):
         varargs = {"var0": None if self._var0 is None else self._var0,
-                   "var_units": None if self._var0 is None else self._var0.u.copy()}
+                   "var_units": None if self._var0 is None else self._var0.u}
         if self.__DEBUG: logger.error(f"MULT: as DPQs: {self} x {other}")   
         if isinstance(other, DependantPhysicalQuantity):
             nn = polymul(self.num, other.num)
@@ -369,13 +387,13 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
         else: #try scalar multiply
             nn = self.num.copy()*other
             nd = self.den.copy()
-            nu = self.u.copy() # do we need the copy?
+            nu = self.u
         return DependantPhysicalQuantity(num=nn, den=nd, units=nu, **varargs)
 
     def __rmul__(self, other):
         # same implementation as mul... no difference...
         varargs = {"var0": None if self._var0 is None else self._var0,
-                   "var_units": None if self._var0 is None else self._var0.u.copy()}
+                   "var_units": None if self._var0 is None else self._var0.u}
         if isinstance(other, DependantPhysicalQuantity):
             if self.__DEBUG: logger.error(f"MULT: as DPQs: {self} x {other}")   
             nn = polymul(self.num, other.num)
@@ -390,26 +408,26 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
         else: #try scalar multiply
             nn = self.num.copy()*other
             nd = self.den.copy()
-            nu = self.u.copy() # do we need the copy?
+            nu = self.u
         return DependantPhysicalQuantity(num=nn, den=nd, units=nu, **varargs)
 
     def __sub__(self, other):
         varargs = {"var0": None if self._var0 is None else self._var0,
-                   "var_units": None if self._var0 is None else self._var0.u.copy()}
+                   "var_units": None if self._var0 is None else self._var0.u}
         if isinstance(other, DependantPhysicalQuantity):
             if self.u != other.u: raise UnitsMissmatchException(u1=self.u, u2=other.u, operation="sub")
             nd = polymul(self.den, other.den)
             num_a = polymul(self.num, other.den) 
             num_b = polymul(self.den, other.num) 
             nn = polysub(num_a, num_b)
-            nu = self.u.copy()
+            nu = self.u
         elif isinstance(other, PhysicalQuantity):
             if self.u != other.u: raise UnitsMissmatchException(u1=self.u, u2=other.u, operation="sub")
             nd = self.den.copy() # type: ignore
             num_a = self.num
-            num_b = self.den*other.v*other.p #type: ignore
+            num_b = self.den*other.v*other.p.f #type: ignore
             nn = polysub(num_a, num_b)
-            nu = self.u.copy()
+            nu = self.u
         elif ERROR_ON_UNITLESS_OPERATORS: # try as scalar? Assuming units..
             raise TypeError(f"Unable to subtract - no units on other? Acting on [{self}] - [{other}]")
         else: # try as scalar? Assuming units..
@@ -418,26 +436,26 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
             num_a = self.num
             num_b = self.den*other #type: ignore
             nn = polysub(num_a, num_b)
-            nu = self.u.copy()
+            nu = self.u
         return DependantPhysicalQuantity(num=nn, den=nd, units=nu, **varargs)
 
     def __rsub__(self, other):
         varargs = {"var0": None if self._var0 is None else self._var0,
-                   "var_units": None if self._var0 is None else self._var0.u.copy()}
+                   "var_units": None if self._var0 is None else self._var0.u}
         if isinstance(other, DependantPhysicalQuantity):
             if self.u != other.u: raise UnitsMissmatchException(u1=other.u, u2=self.u, operation="rsub")
             nd = polymul(self.den, other.den)
             num_a = polymul(self.num, other.den) 
             num_b = polymul(self.den, other.num) 
             nn = polysub(num_b, num_a)
-            nu = self.u.copy()
+            nu = self.u
         elif isinstance(other, PhysicalQuantity):
             if self.u != other.u: raise UnitsMissmatchException(u1=other.u, u2=self.u, operation="rsub")
             nd = self.den.copy() # type: ignore
             num_a = self.num
-            num_b = self.den*other.v*other.p #type: ignore
+            num_b = self.den*other.v*other.p.f #type: ignore
             nn = polysub(num_b, num_a)
-            nu = self.u.copy()
+            nu = self.u
         elif ERROR_ON_UNITLESS_OPERATORS: # try as scalar? Assuming units..
             raise TypeError(f"Unable to subtract - no units on other? Acting on [{other}] - [{self}]")
         else: # try as scalar? Assuming units..
@@ -446,26 +464,26 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
             num_a = self.num
             num_b = self.den*other #type: ignore
             nn = polysub(num_b, num_a)
-            nu = self.u.copy()
+            nu = self.u
         return DependantPhysicalQuantity(num=nn, den=nd, units=nu, **varargs)
 
     def __add__(self, other):
         varargs = {"var0": None if self._var0 is None else self._var0,
-                   "var_units": None if self._var0 is None else self._var0.u.copy()}
+                   "var_units": None if self._var0 is None else self._var0.u}
         if isinstance(other, DependantPhysicalQuantity):
             if self.u != other.u: raise UnitsMissmatchException(u1=self.u, u2=other.u, operation="add")
             nd = polymul(self.den, other.den)
             num_a = polymul(self.num, other.den) 
             num_b = polymul(self.den, other.num) 
             nn = polyadd(num_a, num_b)
-            nu = self.u.copy()
+            nu = self.u
         elif isinstance(other, PhysicalQuantity):
             if self.u != other.u: raise UnitsMissmatchException(u1=self.u, u2=other.u, operation="add")
             nd = self.den.copy() # type: ignore
             num_a = self.num
-            num_b = self.den*other.v*other.p #type: ignore
+            num_b = self.den*other.v*other.p.f #type: ignore
             nn = polyadd(num_a, num_b)
-            nu = self.u.copy()
+            nu = self.u
         elif ERROR_ON_UNITLESS_OPERATORS: # try as scalar? Assuming units..
             raise TypeError(f"Unable to add - no units on other? Acting on [{self}] + [{other}]")
         else: # try as scalar? Assuming units..
@@ -474,26 +492,26 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
             num_a = self.num
             num_b = self.den*other #type: ignore
             nn = polyadd(num_a, num_b)
-            nu = self.u.copy()
+            nu = self.u
         return DependantPhysicalQuantity(num=nn, den=nd, units=nu, **varargs)
 
     def __radd__(self, other):
         varargs = {"var0": None if self._var0 is None else self._var0,
-                   "var_units": None if self._var0 is None else self._var0.u.copy()}
+                   "var_units": None if self._var0 is None else self._var0.u}
         if isinstance(other, DependantPhysicalQuantity):
             if self.u != other.u: raise UnitsMissmatchException(u1=other.u, u2=self.u, operation="radd")
             nd = polymul(self.den, other.den)
             num_a = polymul(self.num, other.den) 
             num_b = polymul(self.den, other.num) 
             nn = polyadd(num_b, num_a)
-            nu = self.u.copy()
+            nu = self.u
         elif isinstance(other, PhysicalQuantity):
             if self.u != other.u: raise UnitsMissmatchException(u1=other.u, u2=self.u, operation="radd")
             nd = self.den.copy() # type: ignore
             num_a = self.num
-            num_b = self.den*other.v*other.p #type: ignore
+            num_b = self.den*other.v*other.p.f #type: ignore
             nn = polyadd(num_b, num_a)
-            nu = self.u.copy()
+            nu = self.u
         elif ERROR_ON_UNITLESS_OPERATORS: # try as scalar? Assuming units..
             raise TypeError(f"Unable to subtract - no units on other? Acting on [{other}] + [{self}]")
         else: # try as scalar? Assuming units..
@@ -502,12 +520,12 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
             num_a = self.num
             num_b = self.den*other #type: ignore
             nn = polyadd(num_b, num_a)
-            nu = self.u.copy()
+            nu = self.u
         return DependantPhysicalQuantity(num=nn, den=nd, units=nu, **varargs)
 
     def __truediv__(self, other):
         varargs = {"var0": None if self._var0 is None else self._var0,
-                   "var_units": None if self._var0 is None else self._var0.u.copy()}
+                   "var_units": None if self._var0 is None else self._var0.u}
         if isinstance(other, DependantPhysicalQuantity):
             #if self.u != other.u: raise UnitsMissmatchException(u1=self.u, u2=other.u, operation="div")
             nn = polymul(self.num, other.den)
@@ -516,7 +534,7 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
         elif isinstance(other, PhysicalQuantity):
             #if self.u != other.u: raise UnitsMissmatchException(u1=self.u, u2=other.u, operation="div")
             nn = self.num.copy() #type: ignore
-            nd = self.den*(other.v*other.p)
+            nd = self.den*(other.v*other.p.f)
             nu = self.u/other.u
         elif ERROR_ON_UNITLESS_OPERATORS: # try as scalar? Assuming units..
             raise TypeError(f"Unable to divide - no units on other? Acting on [{self}] / [{other}]")
@@ -529,7 +547,7 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
 
     def __rtruediv__(self, other):
         varargs = {"var0": None if self._var0 is None else self._var0,
-                   "var_units": None if self._var0 is None else self._var0.u.copy()}
+                   "var_units": None if self._var0 is None else self._var0.u}
         if isinstance(other, DependantPhysicalQuantity):
             if self.u != other.u: raise UnitsMissmatchException(u1=other.u, u2=self.u, operation="rdiv")
             nn = polymul(other.num, self.den)
@@ -537,7 +555,7 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
             nu = other.u/self.u
         elif isinstance(other, PhysicalQuantity):
             if self.u != other.u: raise UnitsMissmatchException(u1=other.u, u2=self.u, operation="rdiv")
-            nn = self.den.copy()*(other.v*other.p) #type: ignore
+            nn = self.den.copy()*(other.v*other.p.f) #type: ignore
             nd = self.num.copy() #type: ignore
             nu = other.u/self.u
         elif ERROR_ON_UNITLESS_OPERATORS: # try as scalar? Assuming units..
@@ -590,7 +608,7 @@ class DependantPhysicalQuantity(PhysicalQuantityBase):
         vd = polyeval(self.den, val)
 
         # currently should fail if vn or vd have more than one element... ignore types trying to tell us that
-        return PhysicalQuantity.from_value(vn/vd, self.u.copy()) #type: ignore
+        return PhysicalQuantity.from_value(vn/vd, self.u) #type: ignore
 
     @property
     def var0(self):
@@ -1,5 +1,7 @@
 
 import logging
+import bisect
+import math
 
 import numpy as np
 from pyee.utilities import load_data_file
@@ -21,12 +23,21 @@ class Prefix(object):
     Supports multiplication and division.  If used against another Prefix instance, returns a
     new Prefix instance.  Otherwise acts like a number and attempts the operation.
     """
+    __slots__ = ("f", "n", "s")
 
+    # prefix data is stored as parallel sequences sorted by factor, with dicts mapping
+    # symbols and names to an index into them.  the numpy copies are for array lookups.
+    # scalar lookups hand back the shared instances in _data_instances - treat them as read-only.
     _DATA_FILE : str | None = None
-    _data_by_symbol = dict()
-    _data_by_name = dict()
-    _data_by_value = dict()
-    _data_value_scale = dict()
+    _index_by_symbol = dict()
+    _index_by_name = dict()
+    _data_value_scale = list()
+    _data_symbols = list()
+    _data_names = list()
+    _data_value_scale_arr = np.array([])
+    _data_symbol_arr = np.array([])
+    _data_name_arr = np.array([])
+    _data_instances = list()
 
     __DEBUG = False
 
@@ -52,18 +63,13 @@ class Prefix(object):
         :param pstring: prefix string
         :return: prefix object if possible.
         """
-        
-        if cls._DATA_FILE is None: cls.reload_data()
-
-        sym_data = cls._data_by_symbol.get(pstring, None)
-        if sym_data is not None:
-            return cls(pstring, sym_data['factor'], sym_data['name'])
+        idx = cls._index_by_symbol.get(pstring, None)
+        if idx is None:
+            idx = cls._index_by_name.get(pstring, None)
+        if idx is not None:
+            return cls._data_instances[idx]
 
-        sym_data = cls._data_by_name.get(pstring, None)
-        if sym_data is not None:
-            return cls(sym_data['symbol'], sym_data['factor'], pstring)
-
-        raise ValueError(f"Unknown symbol or name for new prefix: {pstring}, {cls._data_by_symbol}")
+        raise ValueError(f"Unknown symbol or name for new prefix: {pstring}, {cls._data_symbols}")
 
     @classmethod
     def from_number(cls, pnum: t_numeric) -> t_PrefixObj:
@@ -71,37 +77,58 @@ class Prefix(object):
         Returns the closest prefix to use for the given number.  Attempts to use a prefix that
         will result in a number formatted "well", meaning 1-3 digits ahead of the decimal place.
 
-        :param pnum: number to find a prefix for
+        If given an array (or list/tuple), returns a single prefix object holding arrays of
+        factors, symbols, and names - one per element.
+
+        Zero gets the unity ("") prefix.  Non-zero numbers below the smallest factor get the
+        smallest prefix.
+
+        :param pnum: number (or array of numbers) to find a prefix for
         :return: new prefix object
         """
-        abs_pnum = abs(pnum)
-        
-        if cls._DATA_FILE is None: cls.reload_data()
+        if isinstance(pnum, (np.ndarray, list, tuple)):
+            idx = np.searchsorted(cls._data_value_scale_arr, np.abs(pnum), side="right") - 1
+            idx = np.clip(idx, 0, len(cls._data_value_scale_arr)-1)
+            idx = np.where(np.asarray(pnum) == 0, cls._index_by_symbol[""], idx)
+            return cls._build(cls._data_symbol_arr[idx], cls._data_value_scale_arr[idx], cls._data_name_arr[idx])
 
-        # if greater than 1, we want the next smallest factor.
-        #scalar was: diffs = [1 if (pnum - v) >= 0 else 0 for v in cls._data_value_scale]
-        diffs = np.array([1*((abs_pnum - v) >= 0) for v in cls._data_value_scale])
-        if cls.__DEBUG: logger.error(f"... ... PREFIX: diffs={diffs}")
+        # we want the largest factor not above the number - the scale is sorted, so bisect it.
+        # bisect on the list avoids numpy temporaries for a single value.  falls back to the smallest factor.
+        if pnum == 0:
+            return cls._data_instances[cls._index_by_symbol[""]]
+        idx = max(bisect.bisect_right(cls._data_value_scale, abs(pnum)) - 1, 0)
+        if cls.__DEBUG: logger.error(f"... ... PREFIX: idx={idx}")
 
+        return cls._data_instances[idx]
 
-        factor = cls._data_value_scale[max(np.max(diffs.nonzero()),0)] #type: ignore , will fail if diffs has too many elements
-        symbol = cls._data_by_value[factor]["symbol"]
-        name = cls._data_by_value[factor]["name"]
-        return cls(symbol, factor, name)
+    @staticmethod
+    def _build(symbol, factor, name) -> t_PrefixObj:
+        """
+        Creates a new prefix object without going through __init__.  Used to build the shared
+        instances in reload_data, and for array results.  Always a plain Prefix, so lookups made
+        through a subclass (such as a prefix product) still work.
+        """
+        pobj = object.__new__(Prefix)
+        pobj.f = factor
+        pobj.n = name
+        pobj.s = symbol
+        return pobj
 
     @classmethod
     def reload_data(cls, datafile : str = "SI_prefixes") -> None:
         cls._DATA_FILE = datafile
-        cls._data_by_symbol = load_data_file(cls._DATA_FILE)
-        cls._data_by_value = {d["factor"]: {"symbol":s, "name":d["name"]} for s, d in cls._data_by_symbol.items()}
-        cls._data_value_scale = sorted(cls._data_by_value.keys())
-        cls._data_by_name = {d["name"]: {"symbol":s, "factor":d["factor"]} for s, d in cls._data_by_symbol.items()}
-
-    def __new__(cls, *args, **kwargs) -> t_PrefixObj:
-        # make sure we have loaded dicts before making an object
-        if cls._DATA_FILE is None: 
-            cls.reload_data()
-        return super().__new__(cls)
+        data_by_symbol = load_data_file(cls._DATA_FILE)
+        ordered = sorted(data_by_symbol.items(), key=lambda sd: sd[1]["factor"])
+        cls._data_value_scale = [d["factor"] for _, d in ordered]
+        cls._data_symbols = [s for s, _ in ordered]
+        cls._data_names = [d["name"] for _, d in ordered]
+        cls._index_by_symbol = {s: i for i, s in enumerate(cls._data_symbols)}
+        cls._index_by_name = {n: i for i, n in enumerate(cls._data_names)}
+        cls._data_value_scale_arr = np.array(cls._data_value_scale)
+        cls._data_symbol_arr = np.array(cls._data_symbols)
+        cls._data_name_arr = np.array(cls._data_names)
+        cls._data_instances = [cls._build(s, f, n) for s, f, n in
+                               zip(cls._data_symbols, cls._data_value_scale, cls._data_names)]
 
     def __init__(self, symbol: str, factor: t_numeric, name : str) -> None:
         self.f = factor
@@ -109,23 +136,23 @@ class Prefix(object):
         self.s = symbol
 
     def __copy__(self):
-        ns = self.s # string, so no need to copy
-        nf = self.f # number, so no need to copy
-        nn = self.n # string, so no need to copy
-        return type(self)(ns, nf, nn)
+        # symbol and name are strings, and factor a number - so no need to copy the parts.
+        # data is already loaded if we exist, so skip the checks in __new__ / __init__
+        return self._build(self.s, self.f, self.n)
 
     def __repr__(self):
-        if self.n == "":
+        if not isinstance(self.n, str):
+            return f"Prefix [Array]: {self.f}"
+        elif self.n == "":
             return f"Prefix [Nameless]: {self.f}"
         else:
             return f"Prefix [{self.s}] {self.n}: {self.f}"
 
     def __str__(self):
-        try: # On success, array, on fial, single value
-            nvals = len(self.s)
-        except TypeError:
+        if isinstance(self.s, str): # single value - symbols are strings, so len() cannot tell
             return self.s
-        
+
+        nvals = len(self.s)
         if nvals < 5:
             return "["+", ".join([f"{v}" for v in self.s])+"]"
         else:
@@ -133,13 +160,13 @@ class Prefix(object):
 
     def __mul__(self, other) -> "t_PrefixObj | t_numeric":
         if isinstance(other, Prefix):
-            return Prefix.from_number(self.f * other.f)
+            return _LazyPrefix(self.f * other.f)
         else:
             return self.f * other
 
     def __rmul__(self, other) -> "t_PrefixObj | t_numeric":
         if isinstance(other, Prefix):
-            return Prefix.from_number(other.f * self.f)
+            return _LazyPrefix(other.f * self.f)
         else:
             return other * self.f
 
@@ -151,33 +178,81 @@ class Prefix(object):
 
     def __truediv__(self, other) -> "t_PrefixObj | t_numeric":
         if isinstance(other, Prefix):
-            return Prefix.from_number(self.f / other.f)
+            return _LazyPrefix(self.f / other.f)
         else:
             return self.f / other
 
     def __rtruediv__(self, other) -> "t_PrefixObj | t_numeric":
         if isinstance(other, Prefix):
-            return Prefix.from_number(other.f / self.f)
+            return _LazyPrefix(other.f / self.f)
         
         if self.__DEBUG: logger.error(f"rdiv for {self} and {other}")
 
         return other / self.f
 
     def __eq__(self, other) -> bool:
-        try:  # if both have a factor, return that equality
+        if isinstance(other, Prefix): # both have a factor, return that equality
             return self.f == other.f
-        except AttributeError:
-            pass
-
-        try: # if other can be a float, try that...
-            return self.f == float(other)
-        except ValueError:
-            pass
+        if isinstance(other, (int, float, np.integer, np.floating)): # compare as a number
+            return self.f == other
+        return NotImplemented # no string equality - it could not share a hash with the factor
 
-        return self.s == other # default to checking by symbol...
+    def __hash__(self) -> int:
+        return hash(self.f) # equal to the hash of any number we compare equal to
 
     def __neq__(self, other) -> bool:
         return not self.__eq__(other)
 
     def copy(self) -> t_PrefixObj:
         return self.__copy__()
+
+class _LazyPrefix(Prefix):
+    """
+    Result of arithmetic between two prefixes.  Holds the exact factor, and only looks up the
+    symbol and name the first time either is used - scaling code usually only wants the factor.
+    Products that land exactly on a table factor take its symbol and name, anything else (1e-30
+    from femto*femto, say) is nameless with the factor as its symbol.
+    """
+    __slots__ = ("_resolved",)
+
+    def __init__(self, factor: t_numeric) -> None:
+        self.f = factor
+        self._resolved = None
+
+    @staticmethod
+    def _label(factor) -> tuple[str, str]:
+        """
+        Symbol and name for a single factor.  Products of table factors carry float round-off
+        (n*k is 1.0000000000000002e-06), so either neighbour within a tight tolerance counts.
+        """
+        idx = bisect.bisect_left(Prefix._data_value_scale, factor)
+        for i in (idx-1, idx):
+            if 0 <= i < len(Prefix._data_value_scale) and math.isclose(Prefix._data_value_scale[i], factor, rel_tol=1e-9):
+                return Prefix._data_symbols[i], Prefix._data_names[i]
+        return f"{factor:g}", ""
+
+    def _resolve(self) -> tuple:
+        if self._resolved is None:
+            if isinstance(self.f, np.ndarray):
+                labels = [self._label(f) for f in self.f.flat]
+                self._resolved = (np.array([s for s, _ in labels]).reshape(self.f.shape),
+                                  np.array([n for _, n in labels]).reshape(self.f.shape))
+            else:
+                self._resolved = self._label(self.f)
+        return self._resolved
+
+    @property
+    def s(self):
+        return self._resolve()[0]
+
+    @property
+    def n(self):
+        return self._resolve()[1]
+
+    def __copy__(self):
+        pobj = _LazyPrefix(self.f)
+        pobj._resolved = self._resolved
+        return pobj
+
+# load the default table at import, so lookups never need to check for it
+Prefix.reload_data()
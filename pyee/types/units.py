@@ -18,13 +18,16 @@ Attempting to write pascals as "kg/m.s^2" is incorrect.
 
 """
 
-import re
+from __future__ import annotations
+
+import sys
 import logging
+import weakref
+import functools
+import collections
 
 from typing import Callable
-from functools import singledispatchmethod
 
-from pyee.config import OptionsConfigParameter # import so we can register for single dispatch... do we need to?
 from pyee.utilities import load_data_file
 from pyee.exceptions import UnitsMissmatchException, UnitsConversionException, UnitsConstructionException
 
@@ -33,6 +36,24 @@ type t_UnitsSource = str | dict | t_UnitObj | None
 
 logger = logging.getLogger(__name__)
 
+_NUMBER_TYPES = (int, float, complex) # plain numbers act as unitless in units maths
+
+def _identity_conversion(x):
+    """
+    Conversion function between equal units - shared rather than made per convert_to call.
+    """
+    return x
+
+def _affine_conversion(offset: float, scale: float) -> Callable:
+    """
+    Returns a conversion function x -> offset + scale*x, with both factors bound as locals.
+    Works on numbers and numpy arrays alike.  Pure scalings skip the add, which saves a
+    temporary array on every call for array inputs.
+    """
+    if offset == 0:
+        return lambda x: scale*x
+    return lambda x: offset + scale*x
+
 def load_unit_context(context: str) -> dict:
     """
     Loads a set of units from a json file.  the filename to be loaded is
@@ -41,18 +62,34 @@ def load_unit_context(context: str) -> dict:
 
     :param context: file identifier to load
     :return: dictionary mapping unit symbol to unit name, description, and base, where
-        base is a representation of the unit in SI base types.
+        base is a representation of the unit in SI base types.  Also includes reverse
+        lookups from the (interned) base units to the symbol (_by_sig) and to the substitution (_subs_by_sig).
     """
     fname = f"SI_units_{context.lower()}"
     rdat = load_data_file(fname)
-    subs = rdat.pop("_subs",dict())
+    subs = rdat.get("_subs",dict()) # rdat is shared with the file cache, so read it without popping
     cdat = {s: {"n":d["name"], "info":d["quantity"], "u":Units.from_string(d["base"]), 
-                "c": d.get("conversions", dict())} for s, d in rdat.items()}
+                "c": d.get("conversions", dict())} for s, d in rdat.items() if s != "_subs"}
+    for s, d in cdat.items(): # built once here, rather than per convert_to / simplify call
+        d["cfn"] = {k: _affine_conversion(*v) for k, v in d["c"].items()}
+        d["self"] = Units.from_string(s, context=context) # the unit itself, as returned by simplify
     cdat["_subs"] = {k: (Units.from_string(k, context=context), Units.from_string(v, context=context)) for k, v in subs.items()}
+    by_sig = dict()
+    for s, d in cdat.items():
+        if s[0] != "_":
+            by_sig.setdefault(d["u"], s) # first entry wins, as in a linear scan
+    subs_by_sig = dict()
+    for su, sv in cdat["_subs"].values():
+        subs_by_sig.setdefault(su, sv)
+    cdat["_by_sig"] = by_sig
+    cdat["_subs_by_sig"] = subs_by_sig
     return cdat
 
 class Units(object):
+    __slots__ = ("s", "context", "_canon", "_hash", "_repr", "_n", "_d", "__weakref__") # weakref for interning
+
     CONTEXTS = dict()
+    _INTERNED = weakref.WeakValueDictionary() # (class, canonical tuple, context) -> live instance
     __DEBUG=False
 
     @classmethod
@@ -62,7 +99,6 @@ class Units(object):
         """
         return cls(dict(), **kwargs)
 
-    @singledispatchmethod
     @classmethod
     def from_any(cls, other : t_UnitsSource) -> t_UnitObj:
         """
@@ -73,131 +109,135 @@ class Units(object):
             return other
         elif other is None: # return empty unit (unitless)
             return cls.create_unitless()
+        elif isinstance(other, str):
+            return cls.from_string(other)
+        elif isinstance(getattr(other, "parameter", None), str): # config parameters (OptionsConfigParameter)
+            return cls.from_string(other.parameter)
+        elif isinstance(other, dict):
+            return cls(other)
+        elif hasattr(other, "keys") and hasattr(other, "items"): # dictionary like
+            return cls(dict(other.items())) #type: ignore
+
+        logger.error(f"Unable to make new unit from {other}")
+        raise TypeError(f"Unable to make new unit from {other}")
 
-        try: # maybe string like enough?
-            return cls.from_string(other) #type: ignore
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Units from any failed on from_string for input: {other}.  Failure was: {e}")   
-
-        try: # dictionary like?
-            len(other) #type: ignore
-            other.keys() #type: ignore
-            other.items() #type: ignore
-            return cls(other) #type: ignore
-        except (ValueError, TypeError, AttributeError) as e:
-            logger.error(f"Unable to make new unit from {other}")
-            raise TypeError(f"Unable to make new unit from {other}.  Original exception was {e}")
-
-    @from_any.register
     @classmethod
-    def _(cls, other: str):
-        return cls.from_string(other)
-    
-    @from_any.register
-    @classmethod
-    def _(cls, other: OptionsConfigParameter):
-        return cls.from_string(other.parameter)
-
-    @classmethod
-    def from_string(cls, ustring : str, **kwargs) -> t_UnitObj:
+    @functools.lru_cache(maxsize=512)
+    def from_string(cls, ustring : str, context : str = "Electrical") -> t_UnitObj:
         """
-        Creates a Unit object from a string representation.
+        Creates a Unit object from a string representation.  Cached - units are interned and
+        immutable, and the same handful of unit strings get parsed over and over (every new
+        impedance parses "V/A", for example).
 
         :param ustring: units strng
+        :param context: units context for the new instance
         :return: new Units instance
         :raises TypeError: if input is not string type
         :raises ValueError: if ustring cannot be split cleanly
         """
+        return cls(dict(cls._parse_ustring(ustring)), context=context)
 
-        # hanging dots are tricky... remove them with a regex... maybe we can algo our way out of it later.
-        def group_replace(match):
-            group_text = match.group(0)
-            return group_text.replace(".", "")
-        ustring_clean = re.sub(r"(?:\()(\.+)|(\.+)(?:\))", group_replace, ustring)
-        
+    @staticmethod
+    def _parse_ustring(ustring : str) -> tuple[tuple[str, int], ...]:
+        """
+        Parses a unit string into (unit, exponent) pairs.  Not cached itself - from_string caches
+        the finished units.  Unit names are interned, as the same few names key every units dict.
 
-        ndparts1 = ustring_clean.split("/") # get num/den parts (can be any number... a/b/c)
-        if cls.__DEBUG:
-            ndparts2 = [nd.split(".") for nd in ndparts1] # each elemnent is split by a dot
-            ndparts3 = [[ep.split("^") for ep in np] for np in ndparts2] # 
-        else:
-            ndparts2 = (nd.split(".") for nd in ndparts1) # each elemnent is split by a dot
-            ndparts3 = ((ep.split("^") for ep in np) for np in ndparts2) # 
-
-        sdict = {}
-        group_sets = [-1]
-        sign_normal = 1
-        for numden in ndparts3:
-            group_sets[-1] = -1*group_sets[-1]
-            for element in numden:
-                try:
-                    base, exp = element
-                except ValueError:
-                    base, exp = (element[0], 1)
-
-                if cls.__DEBUG:
-                    logger.error(f"Converting {ustring}:\n" +
-                                "\n".join(f"{s:15}:{list(o)}" for s, o in {"element": element, "numden": numden, 
-                                                                    "ndparts3": [list(o2) for o2 in ndparts3]}.items()))
-                    logger.error(f"Currently at\n\tgroup_sets: {group_sets}\n\tsign_normal: {sign_normal}\n\tsdict: {sdict}")
-                
-                try: # ugly but... way shorter than cathing it all.  this works fine for debugging.
-                    if base == "":
-                        pass # skip if empty
-                    elif base[0] == "(": # starting a group
-                        # case:       ?(###... starts a new group in any case
-                        #       ...###/(###... sets 'hold' on a negative sign exponent (set normal to -1)
-                        base_clean = base[1:]
-                        if element[-1][-1] == ")": # ending a group, start and end... same as NONE
-                            if group_sets[-1] + sign_normal: # we are the normal sign... 
-                                this_exp = sign_normal
-                            else: # we are not sign normal... must be first after a change. re-set to sign normal after use.
-                                this_exp = group_sets[-1]
-                                group_sets[-1] = sign_normal
-                            try:
-                                exp_int = int(exp[:-1]) # type: ignore , if it existed, its a string << NOT SAME AS NONE
-                                base_cleaner = base_clean
-                            except TypeError as e:
-                                exp_int = int(exp)
-                                base_cleaner = base_clean[:-1] # ugly reset but... meh
-                            sdict[base_cleaner] = sdict.get(base_cleaner, 0) + exp_int*this_exp
-                        else:
-                            sign_normal = group_sets[-1] # if it was negative, new normal is... otherwise not.
-                            group_sets.append(sign_normal) # start a new group
-                            exp_int = int(exp)
-                            sdict[base_clean] = sdict.get(base_clean, 0) + exp_int*sign_normal # really last element, but thats set here.                
-                    elif element[-1][-1] == ")": # ending a group
-                        sign_normal = 1 # if we were negative, its positive now. if we were positive, keep it.
-                        this_exp = group_sets.pop() # this is the last element with the prev sign... maybe
-                        try:
-                            exp_int = int(exp[:-1]) # type: ignore , if it existed, its a string << NOT SAME AS NONE
-                            base_clean = base
-                        except TypeError as e:
-                            exp_int = int(exp)
-                            base_clean = base[:-1] # ugly reset but... meh
-                        sdict[base_clean] = sdict.get(base_clean, 0) + exp_int*this_exp
-                    else: # same group
-                        # this a x: ##x#     stays normal.  maybe -1 if in a group that set that... 
-                        #           ###/x##  
-                        # normal is unchanged, but first item is "not normal"
-                        #           ###/#x##
-                        #           ###/##x#
-                        if group_sets[-1] + sign_normal: # we are the normal sign... 
-                            this_exp = sign_normal
-                        else: # we are not sign normal... must be first after a change. re-set to sign normal after use.
-                            this_exp = group_sets[-1]
-                            group_sets[-1] = sign_normal
-                        exp_int = int(exp)
-                        sdict[base] = sdict.get(base, 0) + exp_int*this_exp
-                except (ValueError, TypeError) as e:
-                    raise UnitsConstructionException(ustring, (element, element[-1][-1], numden, ndparts3), msg=f"Original error: {e}")
-                if cls.__DEBUG:
-                    logger.error(f"After loop... at\n\tgroup_sets: {group_sets}\n\tsign_normal: {sign_normal}\n\tsdict: {sdict}")
+        :param ustring: units strng
+        :return: tuple of (unit, exponent) pairs
+        """
+
+        if "/" not in ustring and "(" not in ustring and ")" not in ustring:
+            # simple case (kg.m^2 and such) - no groups or denominators, so no sign juggling
+            sdict = collections.defaultdict(int)
+            for element in ustring.split("."):
+                if element: # runs of dots leave empty elements - skip them
+                    base, exp = Units._split_element(ustring, element)
+                    sdict[base] += exp
+            _ = sdict.pop("1", None) # remove ones as a base.. 
+            _ = sdict.pop("", None) # remove empty as a base.. 
+            return tuple((sys.intern(k), v) for k, v in sdict.items() if v)
+
+        # single pass over the string.  grammar is
+        #     ustring := item (("." | "/") item)*
+        #     item    := unit ["^" exponent] | "(" ustring ")"
+        # a "/" negates only the next item (unit or whole group), and groups nest by carrying
+        # their sign on a stack - so "m/(s/A)" is m.s^-1.A.  dots next to parentheses are ignored.
+        sdict = collections.defaultdict(int)
+        group_signs = [1]
+        sign_next = 1 # -1 right after a "/", reset once used
+        i, nchars = 0, len(ustring)
+        while i < nchars:
+            c = ustring[i]
+            if c == ".":
+                i += 1
+            elif c == "/":
+                sign_next = -1
+                i += 1
+            elif c == "(":
+                group_signs.append(group_signs[-1]*sign_next)
+                sign_next = 1
+                i += 1
+            elif c == ")":
+                if len(group_signs) == 1:
+                    raise UnitsConstructionException(ustring, (ustring[:i+1],), msg="Unmatched closing parenthesis")
+                group_signs.pop()
+                i += 1
+            else: # unit with optional exponent, runs until the next delimiter
+                j = i + 1
+                while j < nchars and ustring[j] not in "./()":
+                    j += 1
+                base, exp = Units._split_element(ustring, ustring[i:j])
+                sdict[base] += exp*group_signs[-1]*sign_next
+                sign_next = 1
+                i = j
+
+        if Units.__DEBUG: # once per parse, rather than per character
+            logger.error(f"Converted {ustring}:\n\tgroup_signs: {group_signs}\n\tsdict: {sdict}")
+
+        if len(group_signs) != 1:
+            raise UnitsConstructionException(ustring, (group_signs,), msg="Unmatched opening parenthesis")
 
         _ = sdict.pop("1", None) # remove ones as a base.. 
         _ = sdict.pop("", None) # remove empty as a base.. 
-        sdict_clean = {k: v for k, v in sdict.items() if v}
-        obj = cls(sdict_clean, **kwargs)
+        return tuple((sys.intern(k), v) for k, v in sdict.items() if v)
+
+    @staticmethod
+    def _split_element(ustring : str, element : str) -> tuple[str, int]:
+        """
+        Splits one "unit^exponent" element into its unit and integer exponent (1 if not given).
+
+        :raises UnitsConstructionException: if the unit is missing (as in "(m.s)^2" - groups
+            cannot take exponents), or "^" is not followed by a valid integer
+        """
+        base, caret, exp = element.partition("^")
+        if not base:
+            raise UnitsConstructionException(ustring, (element,), msg="Exponent without a unit")
+        if not caret:
+            return base, 1
+        try:
+            return base, int(exp)
+        except ValueError as e:
+            raise UnitsConstructionException(ustring, (element,), msg=f"Original error: {e}")
+
+    def __new__(cls, s : dict | None = None, context : str = "Electrical") -> t_UnitObj:
+        """
+        Units are interned - equal units (and context) share a single instance, so
+        instances must be treated as immutable.  Zero exponents are dropped from s.
+        """
+        s = {k: v for k, v in s.items() if v} if s else dict()
+        key = tuple(sorted(s.items())) # canonical form, sorted by unit
+        obj = cls._INTERNED.get((cls, key, context), None)
+        if obj is None:
+            obj = super().__new__(cls)
+            obj.s = s
+            obj.context = context
+            obj._canon = key
+            obj._hash = hash(key)
+            obj._repr = None
+            obj._n = None
+            obj._d = None
+            cls._INTERNED[(cls, key, context)] = obj
         return obj
 
     def __init__(self, s : dict, context : str = "Electrical") -> None:
@@ -217,29 +257,38 @@ class Units(object):
 
         Stored internally as one dict (s) using negative exponents.
         Unitless instances have s=={}
+
+        All state is set in __new__, as instances are interned and shared.
         """
-        super().__init__()
-        self.s = s
-        self.context = context
 
     def __copy__(self):
-        ns = self.s.copy() # dictionary, so copy it
-        nc = self.context # string, no need to copy
-        return type(self)(s=ns, context=nc)
+        return self # interned and immutable, so no need to copy
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (type(self), (self.s, self.context))
+
+    def __hash__(self):
+        return self._hash
 
     def __repr__(self):
-        p1 = sorted([f"{s}^{e}" if e > 1 else s for s, e in self.s.items() if e > 0])
-        p2 = sorted([f"{s}^{-e}" if e < -1 else s for s, e in self.s.items() if e < 0])
-        return (".".join(p1) if len(p1) else "1")+(f"/({'.'.join(p2)})" if len(p2) else "")
+        if self._repr is not None: # immutable, so only build the string once
+            return self._repr
+        # canonical form is already sorted by unit
+        p1 = [f"{s}^{e}" if e > 1 else s for s, e in self._canon if e > 0]
+        p2 = [f"{s}^{-e}" if e < -1 else s for s, e in self._canon if e < 0]
+        self._repr = (".".join(p1) if len(p1) else "1")+(f"/({'.'.join(p2)})" if len(p2) else "")
+        return self._repr
 
     def __mul__(self, other):
-        try: # get base data if exists
-            s2 = other.s
-        except AttributeError: # if not, try and make a new units from it
-            u2 = self.from_any(other)
-            s2 = u2.s
-        ur = {u: self.s.get(u,0) + s2.get(u,0) for u in set(self.s.keys() | s2.keys())}
-        return Units(ur)
+        if isinstance(other, _NUMBER_TYPES): # numbers are unitless
+            return self
+        other = self._units_from_other(other)
+        if other is None:
+            return NotImplemented
+        return self._product(self, other, 1)
 
     def __rmul__(self, other):
         return self.__mul__(other)
@@ -284,92 +333,142 @@ class Units(object):
 
     def __truediv__(self, other):
         # we are numerator, other is denominator
-        try:  # get base data if exists
-            s2 = other.s
-        except AttributeError:  # if not, try and make a new units from it
-            u2 = self.from_any(other)
-            s2 = u2.s
-
-        ur = {u: self.s.get(u, 0) - s2.get(u, 0) for u in set(self.s.keys() | s2.keys())}
-        return Units(ur)
+        if isinstance(other, _NUMBER_TYPES): # numbers are unitless
+            return self
+        other = self._units_from_other(other)
+        if other is None:
+            return NotImplemented
+        return self._product(self, other, -1)
 
     def __rtruediv__(self, other):
         # we are denominator, other is numerator
-        if other == 1: # simple case... we are just inverting units...
+        if isinstance(other, _NUMBER_TYPES): # simple case... numbers are unitless, we are just inverting units...
             udict_flipped = {k: -v for k, v in self.s.items()}
             return Units(udict_flipped)
 
-        try:  # get base data if exists
-            s2 = other.s
-        except AttributeError:  # if not, try and make a new units from it
-            u2 = self.from_any(other)
-            s2 = u2.s
-
-        ur = {u: s2.get(u, 0) - self.s.get(u, 0) for u in set(self.s.keys() | s2.keys())}
-        return Units(ur)
+        other = self._units_from_other(other)
+        if other is None:
+            return NotImplemented
+        return self._product(other, self, -1)
 
     def __eq__(self, other):
-        try:
-            s2 = other.s
-        except AttributeError:
-            u2 = self.from_any(other)
-            s2 = u2.s
-        
-        return self.s == s2
+        if self is other:
+            return True
+        if isinstance(other, _NUMBER_TYPES): # numbers are unitless
+            return not self._canon
+        if not isinstance(other, Units):
+            try:
+                other = self.from_any(other)
+            except (TypeError, ValueError, UnitsConstructionException):
+                return NotImplemented
+        # differing cached hashes settle most mismatches without walking the tuples
+        return self._hash == other._hash and self._canon == other._canon
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    def _units_from_other(self, other) -> "Units | None":
+        """
+        Returns other as units, converting it first if needed.  Returns None if other cannot
+        be made into units, so operators can return NotImplemented.
+        """
+        if isinstance(other, Units):
+            return other
+        try:
+            return self.from_any(other)
+        except (TypeError, ValueError, UnitsConstructionException):
+            return None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _product(a : "Units", b : "Units", sign : int) -> "Units":
+        """
+        Returns the units of a*b (sign=1) or a/b (sign=-1).  Cached, as units are interned and
+        immutable and the same few products come up over and over in quantity arithmetic.
+        """
+        ur = dict(a.s)
+        for u, e in b.s.items(): # merge in one pass, dropping anything that cancels out
+            ne = ur.get(u, 0) + sign*e
+            if ne:
+                ur[u] = ne
+            else:
+                ur.pop(u, None)
+        return Units(ur)
 
     def convert_to(self, newunits: t_UnitObj) -> Callable:
         """
         Tries to allow unit conversion.  Only really works on base units for now.
-        Returns a function that can be called on numbers to convert to the new units.
+        Returns a function that can be called on numbers to convert to the new units.  The
+        function is a plain affine map, so it can be called on whole numpy arrays at once.
         """
 
         if self == newunits: # take care of easy case first...
-            return lambda x: x
+            return _identity_conversion
 
-        if self.context not in self.CONTEXTS.keys(): # load new context if we do not have it already
-            Units.CONTEXTS[self.context] = load_unit_context(self.context)
-            logger.info(f"Loaded new units context: {self.context}")
-
-        selfinfo = self.CONTEXTS[self.context].get(str(self), None)
+        selfinfo = self._ensure_context(self.context).get(str(self), None)
         if selfinfo is None:
             raise UnitsConversionException(self, newunits, 
                                            notes="Initial units do not exist in context - not a basic unit?")
-        convfactors = selfinfo.get("c", dict()).get(str(newunits), None)
-        if convfactors is None:
+        convfunc = selfinfo["cfn"].get(str(newunits), None)
+        if convfunc is None:
             raise UnitsConversionException(self, newunits, 
                                            notes=f"Cant find a conversion factor... self info is {selfinfo}")            
 
-        return lambda x: convfactors[0] + convfactors[1]*x
+        return convfunc
+
+    @staticmethod
+    def _ensure_context(context : str) -> dict:
+        """
+        Returns the named units context, loading it first if we do not have it already.
+        """
+        cntxt = Units.CONTEXTS.get(context, None)
+        if cntxt is None:
+            cntxt = Units.CONTEXTS[context] = load_unit_context(context)
+            logger.info(f"Loaded new units context: {context}")
+        return cntxt
 
     def as_base(self, context : str | None = None) -> t_UnitObj:
         """
         Expand the units to base units as much as possible.  Uses the instances context
-        if none is give.  If a new context is specified, then updates this units default
-        context to the new value, and loads the context if not already loaded
+        if none is give.  If a new context is specified, then
+        the returned units use the new context (this instance is shared, so is left unchanged),
+        and the context is loaded if not already loaded
         :param context: new context as string, or None to use default
         :return: new units object with expanded units
         """
-        if context is not None:
-            self.context = context
-
-        if self.context not in self.CONTEXTS.keys(): # load new context if we do not have it already
-            Units.CONTEXTS[self.context] = load_unit_context(self.context)
-            logger.info(f"Loaded new units context: {self.context}")
+        if context is None:
+            context = self.context
+
+        self._ensure_context(context)
+        sbase = self._expand_to_base(self._canon, context)
+        if sbase is self._canon and context == self.context: # already base units
+            return self
+        return Units(s=dict(sbase), context=context)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _expand_to_base(key : tuple, context : str) -> tuple[tuple[str, int], ...]:
+        """
+        Expands a canonical units key (sorted tuple of unit, exponent pairs) to base units in the given
+        context, which must already be loaded.  Cached, as the same few units get expanded
+        over and over - contexts are only loaded once so the cache does not go stale.
+        :return: tuple of (unit, exponent) pairs, or key itself if already in base units
+        """
+        cntxt = Units.CONTEXTS[context] # just to avoid typing a bunch...
 
-        cntxt = Units.CONTEXTS[self.context] # just to avoid typing a bunch...
+        if not any(u in cntxt for u, _ in key):
+            return key
 
         sbase = dict()
-        for u, e in self.s.items():
-            if u in cntxt.keys():
+        for u, e in key:
+            if u in cntxt:
                 for su, se in cntxt[u]["u"].s.items():
                     sbase[su] = sbase.get(su,0) + se*e
             else:
                 sbase[u] = sbase.get(u, 0) + e
-        
-        return Units(s=sbase, context=self.context)
+
+        return tuple(sbase.items())
 
     def copy(self) -> "Units":
         return self.__copy__()
@@ -377,8 +476,9 @@ class Units(object):
     def simplify(self, context : str | None = None) -> t_UnitObj:
         """
         Simplify the units as much as possible.  Uses the instances context
-        if none is give.  If a new context is specified, then updates this units default
-        context to the new value, and loads the context if not already loaded
+        if none is give.  If a new context is specified, then the returned units use the new
+        context (this instance is shared, so is left unchanged), and the context is loaded if
+        not already loaded
 
         Only able to perform simplifications included in the context's simplification table, or
         into standard units.  Nothing complicated here... just lookups for common patterns.
@@ -389,30 +489,24 @@ class Units(object):
 
         #TODO check if we are base units, and avoid warning about unable to simplify if so
 
-        if context is not None:
-            self.context = context
+        if context is None:
+            context = self.context
 
-        if self.context not in self.CONTEXTS.keys():  # load new context if we do not have it already
-            Units.CONTEXTS[self.context] = load_unit_context(self.context)
+        cntxt = self._ensure_context(context)
 
-        # check basic units first
-        for name, values in self.CONTEXTS[self.context].items():
-            if name[0] == "_": # check first to avoid error
-                pass
-            elif values["u"] == self:
-                return Units.from_string(name, context=self.context)
-            else: # not found... go to next... do nothing :(
-                pass
+        # check basic units first.  indexes are keyed by interned units, so the lookup
+        # uses the cached hash and usually an identity compare
+        name = cntxt["_by_sig"].get(self, None)
+        if name is not None:
+            return cntxt[name]["self"]
 
         # check subs next
-        for key, value in self.CONTEXTS[self.context]["_subs"].items():
-            if self == value[0]:
-                return value[1].copy()
-            else:
-                pass
+        sub = cntxt["_subs_by_sig"].get(self, None)
+        if sub is not None:
+            return sub
 
         # if we are here, we failed to simplify
-        logger.warning(f"Unable to simplify {self} in context: {self.context}")
+        logger.warning(f"Unable to simplify {self} in context: {context}")
         return self
 
     @property
@@ -421,7 +515,9 @@ class Units(object):
         Numerator sets
         :return: n = [(s, e), ...]
         """
-        return Units({s: e for s, e in self.s.items() if e > 0})
+        if self._n is None: # immutable, so only split once
+            self._n = Units({s: e for s, e in self._canon if e > 0})
+        return self._n
 
     @property
     def d(self):
@@ -429,7 +525,9 @@ class Units(object):
         Denominator sets
         :return: d = [(s, e), ...]
         """
-        return Units({s: -e for s, e in self.s.items() if e < 0})
+        if self._d is None: # immutable, so only split once
+            self._d = Units({s: -e for s, e in self._canon if e < 0})
+        return self._d
 
     @property
     def unitless(self):
@@ -4,6 +4,7 @@ Helper functions to tie it all together
 
 import json
 import os
+import functools
 import pathlib
 import logging
 
@@ -15,15 +16,17 @@ if DATA_ABS_PATH is None:
     DATA_ABS_PATH = pathlib.Path(fpath, DATA_REL_PATH)
 
 
+@functools.lru_cache(maxsize=None)
 def load_data_file(fname):
     """
-    Load a data file from the data directory.
+    Load a data file from the data directory.  Cached, as the data files do not change while
+    running - the returned dict is shared, so treat it as read-only.
 
     :param fname: filename to load. not including suffix or path.
     :return: data loaded from file as dict
     """
 
-    full_path = pathlib.Path(DATA_ABS_PATH, fname+".json")
+    full_path = os.path.join(DATA_ABS_PATH, fname+".json")
 
     with open(full_path,"r") as fobj:
         fdat = json.load(fobj)
@@ -53,6 +53,25 @@ class TestCase_polymul(unittest.TestCase):
         self.assertTrue((polymul(self.a2, self.a3)==numpy.array([0, 0, 0, 0.5, 1])).all())
         self.assertTrue((polymul(self.a3, self.a1)==numpy.array([0, 0, 0.5])).all())
 
+    def test_long_arrays(self):
+        c1 = numpy.arange(1, 101)
+        c2 = numpy.arange(1, 81)[::-1]
+        self.assertListEqual(list(polymul(c1, c2)), list(numpy.convolve(c1, c2)))
+
+    def test_wide_coefficient_range(self):
+        # 70 cascaded (1 + 0.1x) sections, squared - top coefficient is 1e-140
+        c = [1]
+        for _ in range(70):
+            c = polymul(c, [1, 0.1])
+        c2 = polymul(c, c)
+        self.assertEqual(len(c2), 141)
+        self.assertAlmostEqual(c2[-1]/1e-140, 1)
+        self.assertEqual(len(polymul([1]*100+[0]*30, [1]*20)), 119)
+
+    def test_trailing_zeros(self):
+        self.assertListEqual(list(polymul([1, 2, 0], [3, 0])), [3, 6])
+        self.assertListEqual(list(polymul([0, 0], [1, 2])), [0])
+
 class TestCase_polyadd(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -13,6 +13,14 @@ class TestCase_create(unittest.TestCase):
         self.assertEqual(p2.v, 100)
         self.assertEqual(p2.u, "m/s^2")
 
+    def test_from_value_zero(self):
+        p1 = PhysicalQuantity.from_value(0, "V")
+        self.assertEqual(p1.p.s, "")
+        self.assertEqual(p1.v, 0)
+        p2 = PhysicalQuantity.from_value(5, "V")
+        self.assertEqual((p2-p2).p.s, "")
+        self.assertFalse(PhysicalQuantity.from_value(1e-18, "V") == p1)
+
     def test_from_string(self):
         p1 = PhysicalQuantity.from_string("0.0001")
         p2 = PhysicalQuantity.from_string("0.1m")
@@ -20,19 +28,19 @@ class TestCase_create(unittest.TestCase):
         p4 = PhysicalQuantity.from_string("0.1m H")
         
         self.assertAlmostEqual(p1.v, 100)
-        self.assertEqual(p1.p, "u")
+        self.assertEqual(p1.p.s, "u")
         self.assertEqual(p1.u, "1")
 
         self.assertAlmostEqual(p2.v, 100)
-        self.assertEqual(p2.p, "u")
+        self.assertEqual(p2.p.s, "u")
         self.assertEqual(p2.u, "1")
 
         self.assertAlmostEqual(p3.v, 100)
-        self.assertEqual(p3.p, "m")
+        self.assertEqual(p3.p.s, "m")
         self.assertEqual(p3.u, "H")
 
         self.assertAlmostEqual(p4.v, 100)
-        self.assertEqual(p4.p, "u")
+        self.assertEqual(p4.p.s, "u")
         self.assertEqual(p4.u, "H")
 
 class TestCase_math(unittest.TestCase):
@@ -65,6 +73,19 @@ class TestCase_math(unittest.TestCase):
 
         self.assertRaises(TypeError, lambda: p1-p2)
 
+    def test_equals_instance(self):
+        p1 = PhysicalQuantity.from_value(0.1, "V") + PhysicalQuantity.from_value(0.2, "V")
+        self.assertTrue(p1 == PhysicalQuantity.from_value(0.3, "V"))
+        self.assertTrue(PhysicalQuantity.from_string("1000m V") == PhysicalQuantity.from_string("1 V"))
+        self.assertFalse(p1 == PhysicalQuantity.from_value(0.3, "A"))
+        self.assertFalse(p1 == PhysicalQuantity.from_value(0.31, "V"))
+
+    def test_equals_unitless(self):
+        p1 = PhysicalQuantity.from_value(0.1, None) + PhysicalQuantity.from_value(0.2, None)
+        self.assertTrue(p1 == 0.3)
+        self.assertFalse(p1 == 0.31)
+        self.assertFalse(p1 == "0.3")
+
 if __name__ == '__main__':
     import logging
     logging.getLogger().setLevel(logging.INFO)
@@ -49,6 +49,91 @@ class TestCase_from_number(unittest.TestCase):
             p = Prefix.from_number(number)
             self.assertEqual(p.s, symbol, msg=f"Testing for {number} = {symbol}")
 
+    def test_from_number_zero(self):
+        self.assertEqual(Prefix.from_number(0).s, "")
+        self.assertEqual(Prefix.from_number(0.0).s, "")
+        self.assertListEqual(list(Prefix.from_number([0, 1200, 0.0]).s), ["", "k", ""])
+
+    def test_from_number_below_table(self):
+        test_sets = [[1e-18, "f"],
+                     [-1e-20, "f"]]
+        for number, symbol in test_sets:
+            p = Prefix.from_number(number)
+            self.assertEqual(p.s, symbol, msg=f"Testing for {number} = {symbol}")
+
+    def test_from_number_array(self):
+        numbers = [0.000015, -0.0015, 15, 999, 1000, -1215.2]
+        symbols = ["u", "m", "", "", "k", "k"]
+        p = Prefix.from_number(numbers)
+        self.assertListEqual(list(p.s), symbols)
+        for number, symbol, factor in zip(numbers, symbols, p.f):
+            self.assertEqual(factor, Prefix.from_string(symbol).f, msg=f"Testing for {number} = {symbol}")
+
+class TestCase_equality(unittest.TestCase):
+    def test_equals(self):
+        p = Prefix.from_string("k")
+        self.assertTrue(p == Prefix.from_string("kilo"))
+        self.assertTrue(p == 1000)
+        self.assertTrue(p == 1e3)
+        self.assertEqual(p.s, "k")
+        self.assertFalse(p == "k") # compare symbols via .s - strings do not hash like prefixes
+        self.assertFalse(p == None)
+
+    def test_hash(self):
+        pdict = {Prefix.from_string("k"): "kilo"}
+        self.assertEqual(pdict[Prefix.from_number(1200)], "kilo")
+
+    def test_shared_instances(self):
+        p = Prefix.from_string("k")
+        self.assertIs(p, Prefix.from_string("kilo"))
+        self.assertIs(p, Prefix.from_number(1200))
+
+class TestCase_maths(unittest.TestCase):
+    def test_prefix_products(self):
+        test_sets = [["k", "M", "*", "G"],
+                     ["k", "m", "/", "M"],
+                     ["m", "m", "*", "u"],
+                     ["u", "k", "*", "m"]]
+        for p1s, p2s, op, symbol in test_sets:
+            p1 = Prefix.from_string(p1s)
+            p2 = Prefix.from_string(p2s)
+            p = p1*p2 if op == "*" else p1/p2
+            self.assertAlmostEqual(p.f, Prefix.from_string(symbol).f, msg=f"Testing for {p1s}{op}{p2s} = {symbol}")
+            self.assertEqual(p.s, symbol, msg=f"Testing for {p1s}{op}{p2s} = {symbol}")
+            self.assertEqual(p.copy().s, symbol, msg=f"Testing for {p1s}{op}{p2s} = {symbol}")
+
+    def test_prefix_product_keeps_factor(self):
+        f = Prefix.from_string("f")
+        self.assertAlmostEqual((f*f).f/1e-30, 1)
+        self.assertEqual(2*(f*f), 2*f.f*f.f)
+
+    def test_prefix_product_off_table(self):
+        f = Prefix.from_string("f")
+        p = f*f
+        self.assertEqual(p.n, "")
+        self.assertEqual(str(p), "1e-30")
+        self.assertNotEqual(p, "f")
+        self.assertEqual(str(Prefix.from_string("k")*Prefix.from_string("k")), "M")
+
+    def test_prefix_product_round_off(self):
+        # these products are not exact in floating point, but still land on a table factor
+        test_sets = [["n", "k", "*", "u"],
+                     ["f", "G", "*", "u"],
+                     ["u", "k", "/", "n"],
+                     ["p", "f", "/", "k"],
+                     ["", "n", "/", "G"]]
+        for p1s, p2s, op, symbol in test_sets:
+            with self.subTest(product=f"{p1s}{op}{p2s}"):
+                p1 = Prefix.from_string(p1s)
+                p2 = Prefix.from_string(p2s)
+                p = p1*p2 if op == "*" else p1/p2
+                self.assertEqual(p.s, symbol)
+
+    def test_prefix_product_lookups(self):
+        k = Prefix.from_string("k")
+        p = type(k*k).from_number([1, 2000])
+        self.assertListEqual(list(p.s), ["", "k"])
+
 if __name__ == '__main__':
     import logging
     logging.getLogger().setLevel(logging.INFO)
@@ -1,6 +1,7 @@
 import unittest
 import numpy as np
 from pyee.types.units import Units
+from pyee.exceptions import UnitsConstructionException
 
 class TestCase_from_string(unittest.TestCase):
     def test_create_empty_units_function(self):
@@ -10,8 +11,9 @@ class TestCase_from_string(unittest.TestCase):
     def test_create_empty_units_string(self):
         empty_strs = ["1", "1/1", "1/(1)", "(1)/1", "s/s", "s.s^-1"]
         for ustring in empty_strs:
-            u = Units.from_string(ustring)
-            self.assertDictEqual(u.s, {})
+            with self.subTest(ustring=ustring):
+                u = Units.from_string(ustring)
+                self.assertDictEqual(u.s, {})
 
     def test_create_empty_units_direct(self):
         u = Units({})
@@ -24,8 +26,9 @@ class TestCase_from_string(unittest.TestCase):
                      "m^-1.s":{"m": -1, "s": 1},
                      "m.s.kg^2":{"m": 1, "s": 1, "kg":2}}
         for ustring, sdict in test_sets.items():
-            u = Units.from_string(ustring)
-            self.assertDictEqual(u.s, sdict)
+            with self.subTest(ustring=ustring):
+                u = Units.from_string(ustring)
+                self.assertDictEqual(u.s, sdict)
 
     def test_create_simple_2(self):
         # no demoninator, with parethesis
@@ -35,8 +38,9 @@ class TestCase_from_string(unittest.TestCase):
                      "(m^-1).s":{"m": -1, "s": 1},
                      "m.(s).kg^2":{"m": 1, "s": 1, "kg":2}}
         for ustring, sdict in test_sets.items():
-            u = Units.from_string(ustring)
-            self.assertDictEqual(u.s, sdict)
+            with self.subTest(ustring=ustring):
+                u = Units.from_string(ustring)
+                self.assertDictEqual(u.s, sdict)
 
     def test_create_unit_denominator(self):
         # unit denominator and paranthensis
@@ -45,8 +49,9 @@ class TestCase_from_string(unittest.TestCase):
                      "s^2/(1)":{"s": 2},
                      "s^-1/1":{"s": -1}}
         for ustring, sdict in test_sets.items():
-            u = Units.from_string(ustring)
-            self.assertDictEqual(u.s, sdict)
+            with self.subTest(ustring=ustring):
+                u = Units.from_string(ustring)
+                self.assertDictEqual(u.s, sdict)
 
     def test_create_unit_numerator(self):
         # unit numerator and paranthensis
@@ -56,8 +61,9 @@ class TestCase_from_string(unittest.TestCase):
                      "1/(s^2)":{"s": -2},
                      "1/s^-1":{"s": 1}}
         for ustring, sdict in test_sets.items():
-            u = Units.from_string(ustring)
-            self.assertDictEqual(u.s, sdict)
+            with self.subTest(ustring=ustring):
+                u = Units.from_string(ustring)
+                self.assertDictEqual(u.s, sdict)
 
     def test_create_multiple_den(self):
         # everything else, split out portions as we find issues.
@@ -67,20 +73,22 @@ class TestCase_from_string(unittest.TestCase):
                      "kg/s/A/s":{"kg": 1, "s": -2, "A":-1},
                      "m/kg/(A.s)":{"m": 1, "kg": -1, "s": -1, "A":-1}}
         for ustring, sdict in test_sets.items():
-            u = Units.from_string(ustring)
-            self.assertDictEqual(u.s, sdict)
+            with self.subTest(ustring=ustring):
+                u = Units.from_string(ustring)
+                self.assertDictEqual(u.s, sdict)
 
     def test_create_dots(self):
         # everything else, split out portions as we find issues.
         test_sets = {"m/(.s/A)":{"m": 1, "s": -1, "A": 1},
-                     "m/(s.)/s":{"m": 1, "s": -2}}#,
-#                    "m/(s/s.)":{"m": 1},
- #                    ".kg/s/A/s":{"kg": 1, "s": -2, "A":-1},
-  #                   "(.kg)/A/s/A":{"kg": 1, "A": -2, "s":-1},
-   #                  "m/.kg./(A.s...)":{"m": 1, "kg": -1, "s": -1, "A":-1}}
+                     "m/(s.)/s":{"m": 1, "s": -2},
+                     "m/(s/s.)":{"m": 1},
+                     ".kg/s/A/s":{"kg": 1, "s": -2, "A":-1},
+                     "(.kg)/A/s/A":{"kg": 1, "A": -2, "s":-1},
+                     "m/.kg./(A.s...)":{"m": 1, "kg": -1, "s": -1, "A":-1}}
         for ustring, sdict in test_sets.items():
-            u = Units.from_string(ustring)
-            self.assertDictEqual(u.s, sdict)
+            with self.subTest(ustring=ustring):
+                u = Units.from_string(ustring)
+                self.assertDictEqual(u.s, sdict)
 
     def test_create_full(self):
         # everything else, split out portions as we find issues.
@@ -89,10 +97,20 @@ class TestCase_from_string(unittest.TestCase):
                      "kg/(.s)":{"kg": 1, "s": -1},
                      "kg/.s":{"kg": 1, "s": -1},
                      "kg/s":{"kg": 1, "s": -1},
-                     "kg/(1.s)":{"kg": 1, "s": -1}}
+                     "kg/(1.s)":{"kg": 1, "s": -1},
+                     "kg/(m.s)/A":{"kg": 1, "m": -1, "s": -1, "A": -1}}
         for ustring, sdict in test_sets.items():
-            u = Units.from_string(ustring)
-            self.assertDictEqual(u.s, sdict)
+            with self.subTest(ustring=ustring):
+                u = Units.from_string(ustring)
+                self.assertDictEqual(u.s, sdict)
+
+    def test_create_malformed(self):
+        # exponents on groups, missing exponents, and exponents without a unit
+        bad_strs = ["(m.s)^2", "m/(s)^-1", "s^", "m/s^", "^2", "m.^2", "m/s^x"]
+        for ustring in bad_strs:
+            with self.subTest(ustring=ustring):
+                with self.assertRaises(UnitsConstructionException):
+                    Units.from_string(ustring)
 
 class TestCase_units_maths(unittest.TestCase):
     def test_equals(self):
@@ -104,6 +122,68 @@ class TestCase_units_maths(unittest.TestCase):
             u2 = Units.from_string(u2s)
             self.assertTrue(u1 == u2, msg=f"{u1s} and {u2s}")
 
+    def test_equals_other_types(self):
+        u = Units.from_string("m/s")
+        self.assertTrue(u == "m/s")
+        self.assertTrue(u != "m")
+        self.assertFalse(u == 5)
+        self.assertTrue(u != 5)
+        self.assertTrue(Units.create_unitless() == 5)
+        with self.assertRaises(TypeError):
+            u * object()
+
+    def test_numbers(self):
+        u = Units.from_string("m/s")
+        self.assertIs(u*5, u)
+        self.assertIs(2.5*u, u)
+        self.assertIs(u/5, u)
+        self.assertDictEqual((5/u).s, {"m": -1, "s": 1})
+
+    def test_cancel(self):
+        test_sets = [["kg.m", "kg", {"m": 1}],
+                     ["kg", "kg", {}],
+                     ["m/s", "m/s", {}]]
+        for u1s, u2s, sdict in test_sets:
+            u1 = Units.from_string(u1s)
+            u2 = Units.from_string(u2s)
+            self.assertDictEqual((u1/u2).s, sdict, msg=f"{u1s} / {u2s}")
+            self.assertDictEqual((u2/u1).s, {k: -v for k, v in sdict.items()}, msg=f"{u2s} / {u1s}")
+            self.assertDictEqual((u1*(1/u2)).s, sdict, msg=f"{u1s} * 1/{u2s}")
+
+    def test_interned(self):
+        u1 = Units.from_string("kg.m/s^2")
+        u2 = Units.from_string("m.kg.s^-2")
+        self.assertIs(u1, u2)
+        self.assertIs(u1, Units({"kg": 1, "m": 1, "s": -2, "A": 0}))
+        self.assertEqual(hash(u1), hash(u2))
+        self.assertEqual({u1: "N"}[u2], "N")
+        self.assertIsNot(u1, Units.from_string("kg.m/s^2", context="Frequency"))
+
+    def test_from_string_subclass(self):
+        class SubUnits(Units):
+            __slots__ = ()
+        self.assertIs(type(SubUnits.from_string("m/s")), SubUnits)
+        self.assertIs(type(Units.from_string("m/s")), Units)
+
+class TestCase_simplify(unittest.TestCase):
+    def test_simplify(self):
+        test_sets = [["kg.m^2.s^-3.A^-1", "V"],
+                     ["kg.m^2/(s^3)", "W"],
+                     ["s^-1", "Hz"],
+                     ["V/A", "Ohm"]]
+        for ustring, simple in test_sets:
+            u = Units.from_string(ustring).as_base().simplify()
+            self.assertEqual(str(u), simple, msg=f"Testing for {ustring} = {simple}")
+
+    def test_as_base_already_base(self):
+        u = Units.from_string("kg.m/s^2")
+        self.assertIs(u.as_base(), u)
+        self.assertDictEqual(Units.from_string("V.A").as_base().s, {"kg": 1, "m": 2, "s": -3})
+
+    def test_simplify_unknown(self):
+        u = Units.from_string("kg.m^3")
+        self.assertIs(u.simplify(), u)
+
 class TestCase_convert_to_Frequency(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -115,8 +195,8 @@ class TestCase_convert_to_Frequency(unittest.TestCase):
         fconv2 = self.u_Rad.convert_to(self.u_Rad)
 
         test_vector = np.random.random(10)
-        self.assertListEqual(list(test_vector), list(fconv1(test_vector)))
-        self.assertListEqual(list(test_vector), list(fconv2(test_vector)))
+        np.testing.assert_array_equal(fconv1(test_vector), test_vector)
+        np.testing.assert_array_equal(fconv2(test_vector), test_vector)
 
     def test_Hz_to_Rad(self):
         fconv = self.u_Hz.convert_to(self.u_Rad)
@@ -128,6 +208,11 @@ class TestCase_convert_to_Frequency(unittest.TestCase):
         nv = fconv((2*np.pi))
         self.assertAlmostEqual(nv, 1)
 
+    def test_Hz_to_Rad_array(self):
+        fconv = self.u_Hz.convert_to(self.u_Rad)
+        test_vector = np.random.random(10)
+        self.assertTrue(np.allclose(fconv(test_vector), 2*np.pi*test_vector))
+
 if __name__ == '__main__':
     import logging
     logging.getLogger().setLevel(logging.INFO)